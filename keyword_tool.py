@@ -6,9 +6,9 @@ import json
 import time
 import re
 from bs4 import BeautifulSoup
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlparse
 import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ProcessPoolExecutor, wait, FIRST_COMPLETED
 import tkinter as tk
 from tkinter import messagebox, filedialog
 import ttkbootstrap as ttk
@@ -16,7 +16,73 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.scrolled import ScrolledText
 import threading
 import os
+from itertools import chain, islice
+from collections import deque
+from functools import partial
+import io
+import csv
+import gzip
+import heapq
+import mmap
+import struct
+import sys
+import zlib
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from requests.sessions import Session
+from requests.adapters import HTTPAdapter
+
+DEFAULT_MARKET = "en-US"
+
+ALPHABET_LETTERS = 'abcdefghij'
+
+PROXY_TYPES = ('http', 'socks4', 'socks5')
+
+def build_proxy_config(proxy_type, proxy_url):
+    if proxy_type not in PROXY_TYPES:
+        raise ValueError(f"Unknown proxy type {proxy_type!r}")
+    return {
+        'http': f'{proxy_type}://{proxy_url}',
+        'https': f'{proxy_type}://{proxy_url}'
+    }
+
+AMAZON_MARKETPLACES = {
+    'us': 1, 'uk': 3, 'gb': 3, 'de': 4, 'fr': 5, 'jp': 6, 'ca': 7,
+    'it': 35691, 'es': 44551, 'in': 44571, 'mx': 771770, 'br': 526970, 'au': 111172
+}
+
+MARKET_PATTERN = re.compile(r'^[a-z]{2,3}([-_][A-Za-z]{2})?$')
+
+# Country used when a market names only a language, e.g. "ja" -> ja-JP
+MARKET_DEFAULT_COUNTRIES = {
+    'en': 'us', 'de': 'de', 'fr': 'fr', 'es': 'es', 'it': 'it', 'pt': 'br', 'nl': 'nl', 'pl': 'pl',
+    'ru': 'ru', 'tr': 'tr', 'ja': 'jp', 'ko': 'kr', 'zh': 'cn', 'sv': 'se', 'da': 'dk', 'nb': 'no',
+    'no': 'no', 'fi': 'fi', 'cs': 'cz', 'el': 'gr', 'hu': 'hu', 'ro': 'ro', 'uk': 'ua', 'he': 'il',
+    'ar': 'sa', 'hi': 'in', 'id': 'id', 'th': 'th', 'vi': 'vn'
+}
+
+def parse_market(market):
+    # Markets are "en-US" style strings or (country, language) pairs
+    if not market:
+        market = DEFAULT_MARKET
+    if isinstance(market, (tuple, list)):
+        country, language = market
+        market = f"{language}-{country}"
+    if not isinstance(market, str):
+        raise ValueError(f"Invalid market {market!r}, expected a locale like en-US")
+    market = market.strip()
+    if not MARKET_PATTERN.match(market):
+        raise ValueError(f"Invalid market {market!r}, expected a locale like en-US")
+    language, _, country = market.replace('_', '-').partition('-')
+    if not country:
+        if language not in MARKET_DEFAULT_COUNTRIES:
+            raise ValueError(f"Market {market!r} needs a country, e.g. {language}-XX")
+        country = MARKET_DEFAULT_COUNTRIES[language]
+    return language, country.lower()
+
+def format_market(market):
+    language, country = parse_market(market)
+    return f"{language}-{country.upper()}"
 
 class NetworkTrackingSession(Session):
     def __init__(self):
@@ -24,6 +90,9 @@ class NetworkTrackingSession(Session):
         self.bytes_sent = 0
         self.bytes_received = 0
         self.start_time = time.time()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
 
     def request(self, *args, **kwargs):
         start = time.time()
@@ -44,6 +113,76 @@ class NetworkTrackingSession(Session):
         total_data = (self.bytes_sent + self.bytes_received) / 1024
         return upload_speed, download_speed, total_data
 
+class FetchScheduler:
+    # Runs fetch tasks on a fixed set of threads. Tasks are submitted in groups (one per client in
+    # service mode); the highest priority group goes first and groups at the same priority take
+    # turns task by task, so an urgent job never waits behind every task of an earlier one.
+    # A task tagged with a host only starts once reserve_host(host) grants it a slot, so workers
+    # pick up tasks for idle hosts instead of sleeping on a busy one.
+    def __init__(self, max_workers, reserve_host=None):
+        self.max_workers = max_workers
+        self.reserve_host = reserve_host
+        self.groups = {}
+        self.rotation = []
+        self.threads = []
+        self.condition = threading.Condition()
+
+    def submit(self, fn, *args, group=None, priority=0, host=None):
+        future = Future()
+        key = (priority, group)
+        with self.condition:
+            if key not in self.groups:
+                self.groups[key] = deque()
+                self.rotation.append(key)
+            self.groups[key].append((future, fn, args, host))
+            if len(self.threads) < self.max_workers:
+                thread = threading.Thread(target=self.worker_loop)
+                thread.daemon = True
+                thread.start()
+                self.threads.append(thread)
+            self.condition.notify()
+        return future
+
+    def next_task(self):
+        # Returns (task, None), or (None, seconds until a busy host frees up) when nothing can start
+        blocked = {}
+        for key in sorted(self.rotation, key=lambda key: -key[0]):
+            tasks = self.groups[key]
+            for index, task in enumerate(tasks):
+                host = task[3]
+                if host is not None and self.reserve_host is not None:
+                    if host in blocked:
+                        continue
+                    delay = self.reserve_host(host)
+                    if delay > 0:
+                        blocked[host] = delay
+                        continue
+                del tasks[index]
+                self.rotation.remove(key)
+                if tasks:
+                    self.rotation.append(key)
+                else:
+                    del self.groups[key]
+                return task, None
+        return None, min(blocked.values()) if blocked else None
+
+    def worker_loop(self):
+        while True:
+            with self.condition:
+                task, delay = self.next_task()
+                while task is None:
+                    self.condition.wait(delay)
+                    task, delay = self.next_task()
+                future, fn, args, _ = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
 class InternetKeywordTool:
     def __init__(self):
         self.session = NetworkTrackingSession()
@@ -52,225 +191,290 @@ class InternetKeywordTool:
         })
         self.keywords = set()
         self.proxy_config = None
+        self.max_workers = 8
+        self.cache_ttl = 900
+        self.cache_max_bytes = 32 * 1024 * 1024
+        self.cache_bytes = 0
+        self.response_cache = {}
+        self.cache_lock = threading.Lock()
+        self.default_host_delay = (0.5, 0.5)
+        self.host_delays = {'www.google.com': (1, 2)}
+        self.host_next_request = {}
+        self.host_lock = threading.Lock()
+        self.local = threading.local()
+        self.proxy_health = {}
+        self.scheduler = None
+        self.scheduler_lock = threading.Lock()
+        self.archive = None
         
     def set_proxy(self, proxy_type, proxy_url):
         if proxy_type == "proxyless":
             self.proxy_config = None
             self.session.proxies.clear()
         else:
-            if proxy_type == "http":
-                self.proxy_config = {
-                    'http': f'http://{proxy_url}',
-                    'https': f'http://{proxy_url}'
-                }
-            elif proxy_type == "socks4":
-                self.proxy_config = {
-                    'http': f'socks4://{proxy_url}',
-                    'https': f'socks4://{proxy_url}'
-                }
-            elif proxy_type == "socks5":
-                self.proxy_config = {
-                    'http': f'socks5://{proxy_url}',
-                    'https': f'socks5://{proxy_url}'
-                }
-            if self.proxy_config:
-                self.session.proxies.update(self.proxy_config)
+            self.proxy_config = build_proxy_config(proxy_type, proxy_url)
+            self.session.proxies.update(self.proxy_config)
     
     def test_proxy(self, proxy_type, proxy_url, timeout=10):
         test_session = NetworkTrackingSession()
-        if proxy_type == "http":
-            proxy_config = {
-                'http': f'http://{proxy_url}',
-                'https': f'http://{proxy_url}'
-            }
-        elif proxy_type == "socks4":
-            proxy_config = {
-                'http': f'socks4://{proxy_url}',
-                'https': f'socks4://{proxy_url}'
-            }
-        elif proxy_type == "socks5":
-            proxy_config = {
-                'http': f'socks5://{proxy_url}',
-                'https': f'socks5://{proxy_url}'
-            }
+        start = time.time()
         try:
-            test_session.proxies.update(proxy_config)
+            test_session.proxies.update(build_proxy_config(proxy_type, proxy_url))
             response = test_session.get('http://httpbin.org/ip', timeout=timeout)
             if response.status_code == 200:
-                return True, response.json().get('origin', 'Unknown')
+                result = (True, response.json().get('origin', 'Unknown'))
+            else:
+                result = (False, "Connection failed")
         except Exception as e:
-            return False, str(e)
-        return False, "Connection failed"
+            result = (False, str(e))
+        self.proxy_health[(proxy_type, proxy_url)] = {
+            'valid': result[0],
+            'detail': result[1],
+            'latency': time.time() - start,
+            'checked': time.time()
+        }
+        return result
         
     def get_network_stats(self):
         return self.session.get_network_stats()
+    
+    def reset_network_stats(self):
+        self.session.bytes_sent = 0
+        self.session.bytes_received = 0
+        self.session.start_time = time.time()
+    
+    def get_scheduler(self):
+        # One fetch pool per tool so concurrent searches share workers and connections
+        with self.scheduler_lock:
+            if self.scheduler is None:
+                self.scheduler = FetchScheduler(self.max_workers, reserve_host=self.reserve_host)
+            return self.scheduler
         
-    def get_google_suggestions(self, keyword):
-        suggestions = []
+    def reserve_host(self, host):
+        # Claims the next request slot for host if it is free, otherwise returns the seconds left
+        low, high = self.host_delays.get(host, self.default_host_delay)
+        with self.host_lock:
+            now = time.time()
+            start = self.host_next_request.get(host, 0)
+            if start > now:
+                return start - now
+            self.host_next_request[host] = now + random.uniform(low, high)
+            return 0
+
+    def wait_for_host(self, url):
+        # Spaces out request start times per host, however many workers are fetching
+        host = urlparse(url).netloc
+        if getattr(self.local, 'reserved_host', None) == host:
+            # The scheduler already claimed this host's slot before starting the task
+            self.local.reserved_host = None
+            return
+        low, high = self.host_delays.get(host, self.default_host_delay)
+        with self.host_lock:
+            now = time.time()
+            start = max(now, self.host_next_request.get(host, 0))
+            self.host_next_request[host] = start + random.uniform(low, high)
+        if start > now:
+            time.sleep(start - now)
+    
+    def fetch(self, url, headers=None, timeout=10, provider=None, query=None, market=None, proxies=None):
+        # proxies overrides the session proxy for this request only (used for per-job proxies)
+        active_proxies = proxies if proxies is not None else self.session.proxies
+        cache_key = (url, tuple(sorted((headers or {}).items())), tuple(sorted(active_proxies.items())))
+        with self.cache_lock:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                if cached[0] > time.time():
+                    return cached[1]
+                del self.response_cache[cache_key]
+                self.cache_bytes -= len(cached[1])
+        self.wait_for_host(url)
+        response = self.session.get(url, headers=headers, timeout=timeout, proxies=proxies)
+        text = response.text
+        if self.archive is not None and provider:
+            self.archive.record(provider, query, format_market(market), url, text,
+                                status=response.status_code, headers=dict(response.headers))
+        if response.status_code != 200:
+            return None
+        if len(text) <= self.cache_max_bytes:
+            with self.cache_lock:
+                previous = self.response_cache.pop(cache_key, None)
+                if previous is not None:
+                    self.cache_bytes -= len(previous[1])
+                self.response_cache[cache_key] = (time.time() + self.cache_ttl, text)
+                self.cache_bytes += len(text)
+                while self.cache_bytes > self.cache_max_bytes:
+                    oldest = next(iter(self.response_cache))
+                    self.cache_bytes -= len(self.response_cache.pop(oldest)[1])
+        return text
+    
+    def parse_response(self, provider, keyword, text):
+        parsers = {
+            'google': self.parse_google_suggestions,
+            'bing': self.parse_bing_suggestions,
+            'duckduckgo': self.parse_duckduckgo_suggestions,
+            'youtube': self.parse_youtube_suggestions,
+            'amazon': self.parse_amazon_suggestions,
+            'serp': self.parse_related_searches_from_serp,
+            'alphabet': self.parse_alphabet_suggestions
+        }
+        return parsers[provider](keyword, text)
+        
+    def get_google_suggestions(self, keyword, market=None, proxies=None):
+        language, country = parse_market(market)
         try:
-            url = f"http://suggestqueries.google.com/complete/search?client=chrome&q={quote_plus(keyword)}"
-            response = self.session.get(url, timeout=10)
-            if response.status_code == 200:
-                data = json.loads(response.text)
-                if len(data) > 1:
-                    suggestions.extend(data[1][:15])
+            url = f"http://suggestqueries.google.com/complete/search?client=chrome&hl={quote_plus(language)}&gl={quote_plus(country)}&q={quote_plus(keyword)}"
+            text = self.fetch(url, provider='google', query=keyword, market=market, proxies=proxies)
+            if text:
+                return self.parse_google_suggestions(keyword, text)
         except Exception:
             pass
-        return suggestions
+        return []
     
-    def get_bing_suggestions(self, keyword):
+    def parse_google_suggestions(self, keyword, text):
         suggestions = []
+        data = json.loads(text)
+        if len(data) > 1:
+            suggestions.extend(data[1][:15])
+        return suggestions
+    
+    def get_bing_suggestions(self, keyword, market=None, proxies=None):
+        language, country = parse_market(market)
         try:
-            url = f"https://www.bing.com/AS/Suggestions?pt=page.serp&mkt=en-us&qry={quote_plus(keyword)}&cp=7&cvid=123"
-            response = self.session.get(url, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                suggestion_items = soup.find_all('li', class_='sa_sg')
-                for item in suggestion_items:
-                    query = item.get('query', '')
-                    if query and query != keyword:
-                        suggestions.append(query)
+            url = f"https://www.bing.com/AS/Suggestions?pt=page.serp&mkt={quote_plus(language)}-{quote_plus(country)}&qry={quote_plus(keyword)}&cp=7&cvid=123"
+            text = self.fetch(url, provider='bing', query=keyword, market=market, proxies=proxies)
+            if text:
+                return self.parse_bing_suggestions(keyword, text)
         except Exception:
             pass
-        return suggestions[:10]
+        return []
     
-    def get_duckduckgo_suggestions(self, keyword):
+    def parse_bing_suggestions(self, keyword, text):
         suggestions = []
+        soup = BeautifulSoup(text, 'html.parser')
+        suggestion_items = soup.find_all('li', class_='sa_sg')
+        for item in suggestion_items:
+            query = item.get('query', '')
+            if query and query != keyword:
+                suggestions.append(query)
+        return suggestions[:10]
+    
+    def get_duckduckgo_suggestions(self, keyword, market=None, proxies=None):
+        language, country = parse_market(market)
         try:
-            url = f"https://duckduckgo.com/ac/?q={quote_plus(keyword)}&type=list"
-            response = self.session.get(url, timeout=10)
-            if response.status_code == 200:
-                data = json.loads(response.text)
-                if isinstance(data, list) and len(data) > 1:
-                    suggestions.extend([item['phrase'] for item in data[1] if 'phrase' in item])
+            url = f"https://duckduckgo.com/ac/?q={quote_plus(keyword)}&kl={quote_plus(country)}-{quote_plus(language)}&type=list"
+            text = self.fetch(url, provider='duckduckgo', query=keyword, market=market, proxies=proxies)
+            if text:
+                return self.parse_duckduckgo_suggestions(keyword, text)
         except Exception:
             pass
-        return suggestions[:10]
+        return []
     
-    def get_youtube_suggestions(self, keyword):
+    def parse_duckduckgo_suggestions(self, keyword, text):
         suggestions = []
+        data = json.loads(text)
+        if isinstance(data, list) and len(data) > 1:
+            suggestions.extend([item['phrase'] for item in data[1] if 'phrase' in item])
+        return suggestions[:10]
+    
+    def get_youtube_suggestions(self, keyword, market=None, proxies=None):
+        language, country = parse_market(market)
         try:
-            url = f"https://suggestqueries.google.com/complete/search?client=youtube&ds=yt&q={quote_plus(keyword)}"
-            response = self.session.get(url, timeout=10)
-            if response.status_code == 200:
-                text = response.text
-                if text.startswith('window.google.ac.h('):
-                    json_text = text[19:-1]
-                    data = json.loads(json_text)
-                    if len(data) > 1:
-                        suggestions.extend([item[0] for item in data[1]])
+            url = f"https://suggestqueries.google.com/complete/search?client=youtube&ds=yt&hl={quote_plus(language)}&gl={quote_plus(country)}&q={quote_plus(keyword)}"
+            text = self.fetch(url, provider='youtube', query=keyword, market=market, proxies=proxies)
+            if text:
+                return self.parse_youtube_suggestions(keyword, text)
         except Exception:
             pass
-        return suggestions[:10]
+        return []
     
-    def get_amazon_suggestions(self, keyword):
+    def parse_youtube_suggestions(self, keyword, text):
         suggestions = []
+        if text.startswith('window.google.ac.h('):
+            json_text = text[19:-1]
+            data = json.loads(json_text)
+            if len(data) > 1:
+                suggestions.extend([item[0] for item in data[1]])
+        return suggestions[:10]
+    
+    def get_amazon_suggestions(self, keyword, market=None, proxies=None):
+        language, country = parse_market(market)
         try:
-            url = f"https://completion.amazon.com/search/complete?search-alias=aps&client=amazon-search-ui&mkt=1&q={quote_plus(keyword)}"
-            response = self.session.get(url, timeout=10)
-            if response.status_code == 200:
-                data = json.loads(response.text)
-                if len(data) > 1:
-                    suggestions.extend(data[1])
+            marketplace = AMAZON_MARKETPLACES.get(country, 1)
+            url = f"https://completion.amazon.com/search/complete?search-alias=aps&client=amazon-search-ui&mkt={marketplace}&q={quote_plus(keyword)}"
+            text = self.fetch(url, provider='amazon', query=keyword, market=market, proxies=proxies)
+            if text:
+                return self.parse_amazon_suggestions(keyword, text)
         except Exception:
             pass
+        return []
+    
+    def parse_amazon_suggestions(self, keyword, text):
+        suggestions = []
+        data = json.loads(text)
+        if len(data) > 1:
+            suggestions.extend(data[1])
         return suggestions[:10]
     
-    def get_related_searches_from_serp(self, keyword, page=1):
-        related_searches = []
+    def get_related_searches_from_serp(self, keyword, page=1, market=None, proxies=None):
+        language, country = parse_market(market)
         try:
-            url = f"https://www.google.com/search?q={quote_plus(keyword)}&start={(page-1)*10}"
+            url = f"https://www.google.com/search?q={quote_plus(keyword)}&hl={quote_plus(language)}&gl={quote_plus(country)}&start={(page-1)*10}"
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept-Language': 'en-US,en;q=0.9'
+                'Accept-Language': f'{language}-{country.upper()},{language};q=0.9'
             }
-            response = self.session.get(url, headers=headers, timeout=15)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                related_elements = soup.find_all(['div', 'span'], string=re.compile(r'related|people also|searches for', re.I))
-                for element in soup.find_all('div'):
-                    text = element.get_text().lower()
-                    if 'related searches' in text or 'people also search' in text:
-                        for link in element.find_all('a'):
-                            link_text = link.get_text().strip()
-                            if link_text and len(link_text) > 3 and link_text != keyword:
-                                related_searches.append(link_text)
-                suggestion_divs = soup.find_all('div', {'data-ved': True})
-                for div in suggestion_divs:
-                    text = div.get_text().strip()
-                    if text and len(text.split()) <= 8 and keyword.lower() in text.lower():
-                        related_searches.append(text)
+            html = self.fetch(url, headers=headers, timeout=15, provider='serp', query=keyword, market=market, proxies=proxies)
+            if html:
+                return self.parse_related_searches_from_serp(keyword, html)
         except Exception:
             pass
+        return []
+    
+    def parse_related_searches_from_serp(self, keyword, html):
+        related_searches = []
+        soup = BeautifulSoup(html, 'html.parser')
+        related_elements = soup.find_all(['div', 'span'], string=re.compile(r'related|people also|searches for', re.I))
+        for element in soup.find_all('div'):
+            text = element.get_text().lower()
+            if 'related searches' in text or 'people also search' in text:
+                for link in element.find_all('a'):
+                    link_text = link.get_text().strip()
+                    if link_text and len(link_text) > 3 and link_text != keyword:
+                        related_searches.append(link_text)
+        suggestion_divs = soup.find_all('div', {'data-ved': True})
+        for div in suggestion_divs:
+            text = div.get_text().strip()
+            if text and len(text.split()) <= 8 and keyword.lower() in text.lower():
+                related_searches.append(text)
         return list(set(related_searches))[:15]
     
-    def get_alphabet_suggestions(self, keyword):
+    def get_alphabet_suggestions(self, keyword, market=None, proxies=None):
         alphabet_suggestions = []
-        letters = 'abcdefghijklmnopqrstuvwxyz'
-        def fetch_letter_suggestions(letter):
-            try:
-                query = f"{keyword} {letter}"
-                url = f"http://suggestqueries.google.com/complete/search?client=chrome&q={quote_plus(query)}"
-                response = self.session.get(url, timeout=5)
-                if response.status_code == 200:
-                    data = json.loads(response.text)
-                    if len(data) > 1:
-                        return data[1][:3]
-            except Exception:
-                pass
-            return []
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_letter = {executor.submit(fetch_letter_suggestions, letter): letter for letter in letters[:10]}
-            for future in as_completed(future_to_letter):
-                suggestions = future.result()
-                alphabet_suggestions.extend(suggestions)
+        for letter in ALPHABET_LETTERS:
+            alphabet_suggestions.extend(self.get_alphabet_letter_suggestions(keyword, letter, market, proxies))
         return alphabet_suggestions
     
-    def search_keywords(self, seed_keyword, max_results=200, max_pages=1, progress_callback=None):
-        all_keywords = set()
-        all_keywords.add(seed_keyword)
-        search_functions = [
-            ("Google Autocomplete", self.get_google_suggestions, False),
-            ("Bing Suggestions", self.get_bing_suggestions, False),
-            ("DuckDuckGo Suggestions", self.get_duckduckgo_suggestions, False),
-            ("YouTube Suggestions", self.get_youtube_suggestions, False),
-            ("Amazon Suggestions", self.get_amazon_suggestions, False),
-            ("Google Related Searches", self.get_related_searches_from_serp, True),
-            ("Alphabet Suggestions", self.get_alphabet_suggestions, False)
-        ]
-        total_steps = sum(1 + (max_pages - 1) if supports_pagination else 1 for _, _, supports_pagination in search_functions)
-        current_step = 0
-        for source_name, search_func, supports_pagination in search_functions:
-            try:
-                if supports_pagination:
-                    for page in range(1, max_pages + 1):
-                        if progress_callback:
-                            progress_callback(f"🔍 {source_name} (Page {page}/{max_pages})...")
-                        keywords = search_func(seed_keyword, page=page) if source_name == "Google Related Searches" else search_func(seed_keyword)
-                        if keywords:
-                            valid_keywords = [kw for kw in keywords if kw and len(kw.strip()) > 2]
-                            all_keywords.update(valid_keywords)
-                        current_step += 1
-                        if progress_callback:
-                            progress = (current_step / total_steps) * 100
-                            progress_callback(f"📊 Progress: {progress:.0f}%")
-                        time.sleep(random.uniform(1, 2))
-                else:
-                    if progress_callback:
-                        progress_callback(f"🔍 {source_name}...")
-                    keywords = search_func(seed_keyword)
-                    if keywords:
-                        valid_keywords = [kw for kw in keywords if kw and len(kw.strip()) > 2]
-                        all_keywords.update(valid_keywords)
-                    current_step += 1
-                    if progress_callback:
-                        progress = (current_step / total_steps) * 100
-                        progress_callback(f"📊 Progress: {progress:.0f}%")
-                    time.sleep(0.5)
-            except Exception:
-                pass
+    def get_alphabet_letter_suggestions(self, keyword, letter, market=None, proxies=None):
+        language, country = parse_market(market)
+        try:
+            query = f"{keyword} {letter}"
+            url = f"http://suggestqueries.google.com/complete/search?client=chrome&hl={quote_plus(language)}&gl={quote_plus(country)}&q={quote_plus(query)}"
+            text = self.fetch(url, timeout=5, provider='alphabet', query=query, market=market, proxies=proxies)
+            if text:
+                return self.parse_alphabet_suggestions(query, text)
+        except Exception:
+            pass
+        return []
+    
+    def parse_alphabet_suggestions(self, query, text):
+        data = json.loads(text)
+        if len(data) > 1:
+            return data[1][:3]
+        return []
+    
+    def clean_keywords(self, keywords, max_results):
         cleaned_keywords = []
-        for keyword in all_keywords:
+        for keyword in keywords:
             if keyword and isinstance(keyword, str):
                 keyword = keyword.strip()
                 if (len(keyword) > 2 and 
@@ -283,19 +487,1030 @@ class InternetKeywordTool:
         if len(unique_keywords) > max_results:
             unique_keywords = unique_keywords[:max_results]
         return unique_keywords
+    
+    def search_keywords(self, seed_keyword, max_results=200, max_pages=1, progress_callback=None, markets=None, result_callback=None, proxies=None, group=None, priority=0):
+        # seed_keyword may be a single seed or a list of seeds; with markets set the
+        # result is a dict of locale -> keywords, otherwise a plain list.
+        # result_callback(locale, seed, source_name, keywords) fires as each fetch completes.
+        # proxies, if given, replaces the session proxy for this search only; group and priority
+        # decide how this search's fetches share the pool with other searches
+        seeds = [seed_keyword] if isinstance(seed_keyword, str) else list(seed_keyword)
+        locales = list(dict.fromkeys(format_market(market) for market in (markets or [DEFAULT_MARKET])))
+        # Each task makes one request to the listed host, which the scheduler spaces out
+        search_functions = [
+            ("Google Autocomplete", self.get_google_suggestions, False, 'suggestqueries.google.com'),
+            ("Bing Suggestions", self.get_bing_suggestions, False, 'www.bing.com'),
+            ("DuckDuckGo Suggestions", self.get_duckduckgo_suggestions, False, 'duckduckgo.com'),
+            ("YouTube Suggestions", self.get_youtube_suggestions, False, 'suggestqueries.google.com'),
+            ("Amazon Suggestions", self.get_amazon_suggestions, False, 'completion.amazon.com'),
+            ("Google Related Searches", self.get_related_searches_from_serp, True, 'www.google.com')
+        ]
+        # Alphabet letters are flat tasks so the shared pool bounds every fetch
+        for letter in ALPHABET_LETTERS:
+            search_functions.append(("Alphabet Suggestions", partial(self.get_alphabet_letter_suggestions, letter=letter),
+                                     False, 'suggestqueries.google.com'))
+        tasks = []
+        for seed in seeds:
+            for source_name, search_func, supports_pagination, host in search_functions:
+                for locale in locales:
+                    tasks.append((seed, source_name, search_func, supports_pagination, locale, host))
+        def run_task(task, page):
+            seed, source_name, search_func, supports_pagination, locale, host = task
+            self.local.reserved_host = host
+            try:
+                if supports_pagination:
+                    if progress_callback:
+                        progress_callback(f"🔍 {source_name} [{locale}] (Page {page}/{max_pages})...")
+                    return search_func(seed, page=page, market=locale, proxies=proxies) or []
+                if progress_callback:
+                    progress_callback(f"🔍 {source_name} [{locale}]...")
+                return search_func(seed, market=locale, proxies=proxies) or []
+            except Exception:
+                return []
+            finally:
+                self.local.reserved_host = None
+        all_keywords = {locale: set(seeds) for locale in locales}
+        total_steps = len(tasks)
+        current_step = 0
+        scheduler = self.get_scheduler()
+        def submit(task, page):
+            return scheduler.submit(run_task, task, page, group=group, priority=priority, host=task[5])
+        pending = {submit(task, 1): (index, 1) for index, task in enumerate(tasks)}
+        pages = {}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, page = pending.pop(future)
+                seed, source_name, _, supports_pagination, locale, _ = tasks[index]
+                pages.setdefault(index, []).extend(future.result())
+                if supports_pagination and page < max_pages:
+                    # The next SERP page is only queued once this one is back, so pages stay in order
+                    pending[submit(tasks[index], page + 1)] = (index, page + 1)
+                    continue
+                valid_keywords = [kw for kw in pages.pop(index) if kw and len(kw.strip()) > 2]
+                all_keywords[locale].update(valid_keywords)
+                if result_callback and valid_keywords:
+                    result_callback(locale, seed, source_name, valid_keywords)
+                current_step += 1
+                if progress_callback:
+                    progress = (current_step / total_steps) * 100
+                    progress_callback(f"📊 Progress: {progress:.0f}%")
+        results = {locale: self.clean_keywords(all_keywords[locale], max_results) for locale in locales}
+        if markets is None:
+            return results[locales[0]]
+        return results
+
+class ResponseArchive:
+    # Append-only store of raw provider responses: zlib-compressed bodies in `path`, and one
+    # JSON line per body in `path.idx` recording its offset, provider, query, market, HTTP
+    # status, response headers and time
+    def __init__(self, path, compression_level=6):
+        self.path = path
+        self.index_path = f"{path}.idx"
+        self.compression_level = compression_level
+        self.data_file = None
+        self.index_file = None
+        self.lock = threading.Lock()
+
+    def record(self, provider, query, market, url, text, status=200, headers=None):
+        blob = zlib.compress(text.encode('utf-8'), self.compression_level)
+        with self.lock:
+            if self.data_file is None:
+                self.data_file = open(self.path, 'ab')
+                self.index_file = open(self.index_path, 'a', encoding='utf-8')
+            offset = self.data_file.seek(0, os.SEEK_END)
+            self.data_file.write(blob)
+            self.data_file.flush()
+            entry = {
+                'offset': offset,
+                'length': len(blob),
+                'provider': provider,
+                'query': query,
+                'market': market,
+                'url': url,
+                'status': status,
+                'headers': headers or {},
+                'time': time.time()
+            }
+            self.index_file.write(json.dumps(entry) + '\n')
+            self.index_file.flush()
+
+    def entries(self, provider=None, query=None, since=None, until=None):
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A torn last line from an interrupted write
+                    continue
+                if provider and entry['provider'] != provider:
+                    continue
+                if query and entry['query'] != query:
+                    continue
+                if since and entry['time'] < since:
+                    continue
+                if until and entry['time'] > until:
+                    continue
+                yield entry
+
+    def read(self, entry, data_file=None):
+        if data_file is None:
+            with open(self.path, 'rb') as data_file:
+                return self.read(entry, data_file)
+        data_file.seek(entry['offset'])
+        return zlib.decompress(data_file.read(entry['length'])).decode('utf-8')
+
+    def close(self):
+        with self.lock:
+            if self.data_file is not None:
+                self.data_file.close()
+                self.index_file.close()
+                self.data_file = None
+                self.index_file = None
+
+def replay_archive_chunk(path, entries, max_results):
+    tool = InternetKeywordTool()
+    archive = ResponseArchive(path)
+    results = []
+    with open(path, 'rb') as data_file:
+        for entry in entries:
+            # Errors, rate limits and captchas are kept as fixtures but have nothing to parse
+            if entry.get('status', 200) != 200:
+                continue
+            # A crashing parser is reported in `error` rather than passing for "no suggestions"
+            error = None
+            try:
+                keywords = tool.parse_response(entry['provider'], entry['query'], archive.read(entry, data_file))
+            except Exception as e:
+                keywords = []
+                error = f"{type(e).__name__}: {e}"
+            valid_keywords = [kw for kw in keywords if kw and len(kw.strip()) > 2]
+            results.append(dict(entry, keywords=tool.clean_keywords(valid_keywords, max_results), error=error))
+    return results
+
+def replay_archive(path, workers=None, chunk_size=256, max_results=200, **filters):
+    # Re-runs the parse and clean pipeline over recorded responses without touching the network
+    entries = list(ResponseArchive(path).entries(**filters))
+    chunks = [entries[i:i + chunk_size] for i in range(0, len(entries), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for results in executor.map(replay_archive_chunk, [path] * len(chunks), chunks, [max_results] * len(chunks)):
+            yield from results
+
+KEYWORD_EXPORT_COLUMNS = [('keyword', 'str'), ('locale', 'str'), ('source', 'str'), ('seed', 'str'), ('rank', 'int')]
+PROXY_EXPORT_COLUMNS = [('proxy', 'str'), ('type', 'str'), ('valid', 'bool'), ('latency_ms', 'float'),
+                        ('checked_at', 'float'), ('detail', 'str')]
+
+def keyword_record_key(keyword, locale, source, seed, rank):
+    # Keyword metadata is kept in a KeywordIndex as NUL-separated keys; NUL sorts below every
+    # other byte, so records line up with the keyword index for a streaming merge
+    fields = [keyword, locale, source, seed, '' if rank is None else str(rank)]
+    return '\0'.join((field or '').replace('\0', '') for field in fields)
+
+def iter_keyword_rows(keywords, records):
+    # One row per (keyword, locale), keeping the best-ranked record; keywords without any
+    # record get a single row with empty metadata
+    record_keys = records.iter_keys()
+    record = next(record_keys, None)
+    for key in keywords.iter_keys():
+        marker = key + b'\0'
+        while record is not None and record < marker:
+            record = next(record_keys, None)
+        best = {}
+        while record is not None and record.startswith(marker):
+            locale, source, seed, rank = record[len(marker):].decode('utf-8').split('\0')
+            rank = int(rank) if rank else None
+            current = best.get(locale)
+            if current is None or (rank or sys.maxsize, source) < (current[2] or sys.maxsize, current[0]):
+                best[locale] = (source, seed, rank)
+            record = next(record_keys, None)
+        keyword = key.decode('utf-8')
+        if not best:
+            yield (keyword, None, None, None, None)
+        for locale in sorted(best):
+            source, seed, rank = best[locale]
+            yield (keyword, locale or None, source or None, seed or None, rank)
+
+def detect_export_format(path):
+    name = path.lower()
+    compression = None
+    if name.endswith('.gz'):
+        compression = 'gzip'
+        name = name[:-3]
+    elif name.endswith('.zst'):
+        compression = 'zstd'
+        name = name[:-4]
+    extension = os.path.splitext(name)[1].lstrip('.')
+    formats = {'txt': 'txt', 'csv': 'csv', 'jsonl': 'jsonl', 'ndjson': 'jsonl', 'parquet': 'parquet',
+               'arrow': 'arrow', 'feather': 'arrow'}
+    if extension not in formats:
+        raise ValueError(f"Unsupported export file type: {os.path.basename(path)} "
+                         "(use .txt, .csv, .jsonl, .parquet or .arrow)")
+    if formats[extension] in ('parquet', 'arrow') and compression:
+        # Columnar files compress their data internally (see export_rows' codec), so a .gz/.zst
+        # name would promise a file that gzip or zstd can't read
+        raise ValueError(f"{formats[extension].title()} files can't take a .gz/.zst suffix; "
+                         "they are compressed internally")
+    return formats[extension], compression
+
+def open_export_text(path, compression=None):
+    if compression == 'gzip':
+        return gzip.open(path, 'wt', encoding='utf-8', newline='', compresslevel=6)
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("zstd export needs the zstandard package (pip install zstandard)")
+        writer = zstandard.ZstdCompressor().stream_writer(open(path, 'wb'))
+        return io.TextIOWrapper(io.BufferedWriter(writer, buffer_size=1 << 20), encoding='utf-8', newline='')
+    return open(path, 'w', encoding='utf-8', newline='', buffering=1 << 20)
+
+def iter_batches(rows, batch_size):
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def export_rows(path, columns, rows, batch_size=50000, progress_callback=None, codec=None):
+    # Streams rows (tuples ordered like columns) to path in the format implied by its extension:
+    # .txt, .csv or .jsonl, optionally followed by .gz or .zst, or .parquet / .arrow. codec sets
+    # the internal compression of the columnar formats (Parquet defaults to snappy, Arrow to none).
+    # The file is written under a temporary name and only renamed into place once it is complete.
+    export_format, compression = detect_export_format(path)
+    temp_path = f"{path}.part"
+    try:
+        count = write_export(temp_path, export_format, compression, columns, rows, batch_size, progress_callback, codec)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return count
+
+def write_export(path, export_format, compression, columns, rows, batch_size, progress_callback, codec=None):
+    names = [name for name, _ in columns]
+    count = 0
+    if export_format in ('parquet', 'arrow'):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet and Arrow export need the pyarrow package (pip install pyarrow)")
+        types = {'str': pa.string(), 'int': pa.int64(), 'float': pa.float64(), 'bool': pa.bool_()}
+        schema = pa.schema([(name, types[column_type]) for name, column_type in columns])
+        if export_format == 'parquet':
+            writer = pq.ParquetWriter(path, schema, compression=codec or 'snappy')
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=codec)
+            writer = pa.ipc.new_file(path, schema, options=options)
+        with writer:
+            for batch in iter_batches(rows, batch_size):
+                arrays = [pa.array([row[i] for row in batch], type=schema.field(i).type) for i in range(len(names))]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                count += len(batch)
+                if progress_callback:
+                    progress_callback(count)
+        return count
+    previous = None
+    with open_export_text(path, compression) as f:
+        if export_format == 'csv':
+            writer = csv.writer(f)
+            writer.writerow(names)
+        for batch in iter_batches(rows, batch_size):
+            if export_format == 'csv':
+                writer.writerows(batch)
+                count += len(batch)
+            elif export_format == 'jsonl':
+                f.writelines(json.dumps(dict(zip(names, row)), ensure_ascii=False) + '\n' for row in batch)
+                count += len(batch)
+            else:
+                # Plain text holds only the first column; rows for the same keyword in other
+                # locales arrive next to each other, so skipping repeats keeps it duplicate-free
+                for row in batch:
+                    if row[0] != previous:
+                        f.write(f"{row[0]}\n")
+                        previous = row[0]
+                        count += 1
+            if progress_callback:
+                progress_callback(count)
+    return count
+
+KEYWORD_INDEX_MAGIC = b'KWIX'
+KEYWORD_INDEX_VERSION = 1
+KEYWORD_INDEX_HEADER = struct.Struct('<4sHHQQQ')
+
+def encode_varint(value):
+    if value < 0x80:
+        return bytes((value,))
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+def decode_varint(data, pos):
+    byte = data[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+def write_keyword_index(out, keys, block_size=16):
+    # keys must be sorted, unique UTF-8 bytes. Each block stores its first key in full and
+    # the rest as (shared prefix length, suffix), followed by a table of block offsets.
+    out.write(b'\0' * KEYWORD_INDEX_HEADER.size)
+    pos = KEYWORD_INDEX_HEADER.size
+    offsets = bytearray()
+    count = 0
+    previous = b''
+    for key in keys:
+        if count % block_size == 0:
+            offsets += struct.pack('<Q', pos)
+            shared = 0
+        else:
+            limit = min(len(previous), len(key))
+            shared = 0
+            while shared < limit and previous[shared] == key[shared]:
+                shared += 1
+        entry = encode_varint(shared) + encode_varint(len(key) - shared) + key[shared:]
+        out.write(entry)
+        pos += len(entry)
+        previous = key
+        count += 1
+    out.write(offsets)
+    out.seek(0)
+    out.write(KEYWORD_INDEX_HEADER.pack(KEYWORD_INDEX_MAGIC, KEYWORD_INDEX_VERSION, block_size,
+                                        count, len(offsets) // 8, pos))
+
+class KeywordIndexSnapshot:
+    # One immutable, front-coded key table (bytes or a memory-mapped file). Readers hold a
+    # reference so a replaced snapshot is only closed once the last iterator is done with it.
+    def __init__(self, data, file=None):
+        try:
+            magic, version, block_size, count, num_blocks, offsets_pos = KEYWORD_INDEX_HEADER.unpack_from(data, 0)
+        except struct.error:
+            raise ValueError("Keyword index file is truncated")
+        if magic != KEYWORD_INDEX_MAGIC or version != KEYWORD_INDEX_VERSION:
+            raise ValueError("Not a keyword index file")
+        if block_size == 0 or offsets_pos + num_blocks * 8 > len(data) or num_blocks * block_size < count:
+            raise ValueError("Keyword index file is truncated or corrupt")
+        self.data = data
+        self.file = file
+        self.block_size = block_size
+        self.count = count
+        self.num_blocks = num_blocks
+        self.offsets_pos = offsets_pos
+        self.readers = 0
+        self.retired = False
+
+    def close(self):
+        if self.file is not None:
+            self.data.close()
+            self.file.close()
+            self.file = None
+
+    def block_offset(self, block):
+        return struct.unpack_from('<Q', self.data, self.offsets_pos + block * 8)[0]
+
+    def first_key(self, block):
+        pos = self.block_offset(block)
+        _, pos = decode_varint(self.data, pos)
+        length, pos = decode_varint(self.data, pos)
+        return self.data[pos:pos + length]
+
+    def find_block(self, key):
+        low, high = 0, self.num_blocks
+        while low < high:
+            middle = (low + high) // 2
+            if self.first_key(middle) <= key:
+                low = middle + 1
+            else:
+                high = middle
+        return low - 1
+
+    def iter_keys(self, start_block=0):
+        data = self.data
+        pos = self.block_offset(start_block) if start_block < self.num_blocks else self.offsets_pos
+        end = self.offsets_pos
+        key = b''
+        while pos < end:
+            shared = data[pos]
+            length = data[pos + 1]
+            if shared < 0x80 and length < 0x80:
+                pos += 2
+            else:
+                shared, pos = decode_varint(data, pos)
+                length, pos = decode_varint(data, pos)
+            key = key[:shared] + data[pos:pos + length]
+            pos += length
+            yield key
+
+    def contains(self, key):
+        block = self.find_block(key)
+        if block < 0:
+            return False
+        for index, candidate in enumerate(self.iter_keys(block)):
+            if candidate >= key or index >= self.block_size:
+                return candidate == key
+        return False
+
+class KeywordIndex:
+    # Sorted, front-coded keyword dictionary: an immutable snapshot plus a small set of pending
+    # additions that is folded in by compact() or save(). Safe to share between threads.
+    def __init__(self, keywords=None, block_size=16, compact_threshold=100000):
+        self.block_size = block_size
+        self.compact_threshold = compact_threshold
+        self.lock = threading.RLock()
+        self.path = None
+        self.snapshot = None
+        self.pending = set()
+        self.replace_snapshot(KeywordIndexSnapshot(self.build([])))
+        if keywords:
+            self.update(keywords)
+
+    @classmethod
+    def open(cls, path):
+        index = cls()
+        index.attach(path)
+        return index
+
+    def build(self, keys):
+        buffer = io.BytesIO()
+        write_keyword_index(buffer, keys, self.block_size)
+        return buffer.getvalue()
+
+    def attach(self, path):
+        file = open(path, 'rb')
+        try:
+            if os.fstat(file.fileno()).st_size < KEYWORD_INDEX_HEADER.size:
+                raise ValueError("Keyword index file is truncated")
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                snapshot = KeywordIndexSnapshot(data, file)
+            except Exception:
+                data.close()
+                raise
+        except Exception:
+            file.close()
+            raise
+        with self.lock:
+            self.replace_snapshot(snapshot)
+            self.path = path
+
+    def replace_snapshot(self, snapshot):
+        with self.lock:
+            previous = self.snapshot
+            self.snapshot = snapshot
+            self.path = None
+            if previous is not None:
+                previous.retired = True
+                if previous.readers == 0:
+                    previous.close()
+
+    def release(self, snapshot):
+        with self.lock:
+            snapshot.readers -= 1
+            if snapshot.retired and snapshot.readers == 0:
+                snapshot.close()
+
+    def iter_keys(self, prefix=b''):
+        # Captures the snapshot and pending keys up front, so the iteration sees a frozen view
+        with self.lock:
+            snapshot = self.snapshot
+            snapshot.readers += 1
+            pending = sorted(key for key in self.pending if key.startswith(prefix))
+        try:
+            start_block = max(snapshot.find_block(prefix), 0) if prefix else 0
+            yield from heapq.merge(snapshot.iter_keys(start_block), pending)
+        finally:
+            self.release(snapshot)
+
+    def add(self, keyword):
+        self.update([keyword])
+
+    def update(self, keywords):
+        keys = {keyword.encode('utf-8') for keyword in keywords}
+        with self.lock:
+            keys.difference_update(self.pending)
+            if len(keys) * 32 > self.snapshot.count:
+                # One sequential pass over the snapshot is cheaper than a binary search per key
+                keys.difference_update(self.snapshot.iter_keys())
+            else:
+                keys = {key for key in keys if not self.snapshot.contains(key)}
+            self.pending.update(keys)
+            if len(self.pending) >= self.compact_threshold:
+                self.compact()
+
+    def compact(self):
+        with self.lock:
+            if self.pending:
+                snapshot = KeywordIndexSnapshot(self.build(self.iter_keys()))
+                self.pending = set()
+                self.replace_snapshot(snapshot)
+
+    def save(self, path):
+        with self.lock:
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'wb', buffering=1 << 20) as out:
+                write_keyword_index(out, self.iter_keys(), self.block_size)
+            detached = self.path == path
+            if detached:
+                # Let go of our own mapping of the file before it is replaced; nobody else
+                # can observe the empty snapshot while we hold the lock
+                self.replace_snapshot(KeywordIndexSnapshot(self.build([])))
+            try:
+                os.replace(temp_path, path)
+            except OSError:
+                if detached:
+                    self.attach(path)
+                raise
+            self.pending = set()
+            self.attach(path)
+
+    def clear(self):
+        with self.lock:
+            self.pending = set()
+            self.replace_snapshot(KeywordIndexSnapshot(self.build([])))
+
+    def prefix(self, prefix, limit=None):
+        key_prefix = prefix.encode('utf-8')
+        found = 0
+        for key in self.iter_keys(key_prefix):
+            if key < key_prefix:
+                continue
+            if not key.startswith(key_prefix) or (limit is not None and found >= limit):
+                return
+            found += 1
+            yield key.decode('utf-8')
+
+    def __contains__(self, keyword):
+        key = keyword.encode('utf-8')
+        with self.lock:
+            return key in self.pending or self.snapshot.contains(key)
+
+    def __len__(self):
+        with self.lock:
+            return self.snapshot.count + len(self.pending)
+
+    def __iter__(self):
+        for key in self.iter_keys():
+            yield key.decode('utf-8')
+
+class KeywordJob:
+    def __init__(self, job_id, client, priority, params):
+        self.id = job_id
+        self.client = client
+        self.priority = priority
+        self.params = params
+        self.status = "queued"
+        self.events = []
+        self.results = None
+        self.error = None
+        self.created = time.time()
+        self.condition = threading.Condition()
+
+    def add_event(self, event):
+        with self.condition:
+            self.events.append(event)
+            self.condition.notify_all()
+
+    def finish(self, status, results=None, error=None):
+        with self.condition:
+            self.status = status
+            self.results = results
+            self.error = error
+            if error is None:
+                self.events.append({'type': 'done', 'results': results})
+            else:
+                self.events.append({'type': 'error', 'error': error})
+            self.condition.notify_all()
+
+    def iter_events(self, timeout=30):
+        # Yields every event from the start, blocking for new ones until the job ends
+        index = 0
+        while True:
+            with self.condition:
+                while index >= len(self.events) and self.status in ("queued", "running"):
+                    if not self.condition.wait(timeout):
+                        break
+                pending = self.events[index:]
+                finished = self.status not in ("queued", "running")
+            for event in pending:
+                yield event
+            index += len(pending)
+            if finished and index >= len(self.events):
+                return
+            if not pending:
+                yield {'type': 'heartbeat'}
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'client': self.client,
+            'priority': self.priority,
+            'status': self.status,
+            'params': self.params,
+            'results': self.results,
+            'error': self.error
+        }
+
+class KeywordJobQueue:
+    # Highest priority first; clients at the same priority are served round-robin
+    def __init__(self):
+        self.client_jobs = {}
+        self.rotation = []
+        self.counter = 0
+        self.condition = threading.Condition()
+
+    def put(self, job):
+        with self.condition:
+            self.counter += 1
+            jobs = self.client_jobs.setdefault(job.client, [])
+            heapq.heappush(jobs, (-job.priority, self.counter, job))
+            if job.client not in self.rotation:
+                self.rotation.append(job.client)
+            self.condition.notify()
+
+    def get(self):
+        with self.condition:
+            while not self.rotation:
+                self.condition.wait()
+            best = min(self.client_jobs[client][0][0] for client in self.rotation)
+            for client in self.rotation:
+                if self.client_jobs[client][0][0] == best:
+                    break
+            job = heapq.heappop(self.client_jobs[client])[2]
+            self.rotation.remove(client)
+            if self.client_jobs[client]:
+                self.rotation.append(client)
+            else:
+                del self.client_jobs[client]
+            return job
+
+    def remove(self, job):
+        with self.condition:
+            jobs = self.client_jobs.get(job.client, [])
+            for entry in jobs:
+                if entry[2] is job:
+                    jobs.remove(entry)
+                    heapq.heapify(jobs)
+                    if not jobs:
+                        del self.client_jobs[job.client]
+                        self.rotation.remove(job.client)
+                    return True
+            return False
+
+    def __len__(self):
+        with self.condition:
+            return sum(len(jobs) for jobs in self.client_jobs.values())
+
+class KeywordService:
+    def __init__(self, tool=None, workers=2, max_finished_jobs=200, proxy_health_ttl=300, max_proxy_tests=20):
+        self.tool = tool or InternetKeywordTool()
+        self.queue = KeywordJobQueue()
+        self.jobs = {}
+        self.jobs_lock = threading.Lock()
+        self.workers = workers
+        self.max_finished_jobs = max_finished_jobs
+        self.proxy_health_ttl = proxy_health_ttl
+        self.max_proxy_tests = max_proxy_tests
+        self.job_counter = 0
+        self.threads = []
+
+    def start(self):
+        for _ in range(self.workers):
+            thread = threading.Thread(target=self.worker_loop)
+            thread.daemon = True
+            thread.start()
+            self.threads.append(thread)
+
+    def submit(self, params, client="default", priority=0):
+        seeds = params.get('seeds') or params.get('seed')
+        if not seeds:
+            raise ValueError("A seed keyword is required")
+        seeds = [seeds] if isinstance(seeds, str) else seeds
+        if not isinstance(seeds, list) or not all(isinstance(seed, str) and seed.strip() for seed in seeds):
+            raise ValueError("seeds must be a list of keywords")
+        markets = params.get('markets') or [DEFAULT_MARKET]
+        if not isinstance(markets, list):
+            raise ValueError("markets must be a list of locales")
+        proxy = params.get('proxy')
+        if proxy is not None:
+            if not isinstance(proxy, dict) or not isinstance(proxy.get('url'), str):
+                raise ValueError("proxy must be an object with type and url")
+            build_proxy_config(proxy.get('type'), proxy['url'])
+            proxy = {'type': proxy['type'], 'url': proxy['url']}
+        params = {
+            'seeds': seeds,
+            'max_results': int(params.get('max_results', 200)),
+            'max_pages': max(1, min(int(params.get('max_pages', 1)), 10)),
+            'markets': [format_market(market) for market in markets],
+            'proxy': proxy
+        }
+        with self.jobs_lock:
+            self.job_counter += 1
+            job = KeywordJob(f"{int(time.time())}-{self.job_counter}", client, int(priority), params)
+            self.jobs[job.id] = job
+        self.queue.put(job)
+        return job
+
+    def get_job(self, job_id):
+        with self.jobs_lock:
+            return self.jobs.get(job_id)
+
+    def cancel(self, job_id):
+        job = self.get_job(job_id)
+        if job and job.status == "queued" and self.queue.remove(job):
+            job.finish("cancelled", error="Cancelled")
+            return True
+        return False
+
+    def worker_loop(self):
+        while True:
+            job = self.queue.get()
+            job.status = "running"
+            params = job.params
+            def on_progress(message):
+                upload_speed, download_speed, total_data = self.tool.get_network_stats()
+                job.add_event({'type': 'progress', 'message': message,
+                               'stats': [upload_speed, download_speed, total_data]})
+            def on_result(locale, seed, source_name, keywords):
+                job.add_event({'type': 'keywords', 'locale': locale, 'seed': seed,
+                               'source': source_name, 'keywords': keywords})
+            # Each job carries its own proxy; the shared session itself never has one set
+            proxy = params['proxy']
+            proxies = build_proxy_config(proxy['type'], proxy['url']) if proxy else {}
+            try:
+                results = self.tool.search_keywords(params['seeds'], params['max_results'], params['max_pages'],
+                                                    progress_callback=on_progress, markets=params['markets'],
+                                                    result_callback=on_result, proxies=proxies,
+                                                    group=job.client, priority=job.priority)
+                job.finish("done", results=results)
+            except Exception as e:
+                job.finish("failed", error=str(e))
+            self.prune_jobs()
+
+    def prune_jobs(self):
+        with self.jobs_lock:
+            finished = [job for job in self.jobs.values() if job.status not in ("queued", "running")]
+            for job in sorted(finished, key=lambda job: job.created)[:-self.max_finished_jobs or None]:
+                del self.jobs[job.id]
+
+    def test_proxies(self, proxy_type, proxies, timeout=5):
+        # Results land in the shared health table and the tests run in the request thread,
+        # so bad input is rejected up front and each request is capped
+        if not isinstance(proxies, list) or not all(isinstance(proxy, str) and proxy.strip() for proxy in proxies):
+            raise ValueError("proxies must be a list of proxy addresses")
+        if len(proxies) > self.max_proxy_tests:
+            raise ValueError(f"At most {self.max_proxy_tests} proxies can be tested per request")
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or not 0 < timeout <= 30:
+            raise ValueError("timeout must be a number of seconds between 0 and 30")
+        build_proxy_config(proxy_type, 'validate')
+        results = {}
+        now = time.time()
+        for proxy in proxies:
+            health = self.tool.proxy_health.get((proxy_type, proxy))
+            if health is None or now - health['checked'] > self.proxy_health_ttl:
+                self.tool.test_proxy(proxy_type, proxy, timeout=timeout)
+                health = self.tool.proxy_health[(proxy_type, proxy)]
+            results[proxy] = health
+        return results
+
+    def get_stats(self):
+        upload_speed, download_speed, total_data = self.tool.get_network_stats()
+        with self.jobs_lock:
+            running = sum(1 for job in self.jobs.values() if job.status == "running")
+        return {
+            'stats': [upload_speed, download_speed, total_data],
+            'queued': len(self.queue),
+            'running': running,
+            'cached_responses': len(self.tool.response_cache)
+        }
+
+class KeywordServiceHandler(BaseHTTPRequestHandler):
+    service = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, data, status=200):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_json(self):
+        length = int(self.headers.get('Content-Length', 0))
+        data = json.loads(self.rfile.read(length) or b'{}') if length else {}
+        if not isinstance(data, dict):
+            raise ValueError("Request body must be a JSON object")
+        return data
+
+    def do_GET(self):
+        parts = [part for part in self.path.split('?')[0].split('/') if part]
+        if parts == ['stats']:
+            return self.send_json(self.service.get_stats())
+        if len(parts) >= 2 and parts[0] == 'jobs':
+            job = self.service.get_job(parts[1])
+            if job is None:
+                return self.send_json({'error': 'Unknown job'}, 404)
+            if len(parts) == 3 and parts[2] == 'stream':
+                return self.stream_job(job)
+            return self.send_json(job.to_dict())
+        self.send_json({'error': 'Not found'}, 404)
+
+    def do_POST(self):
+        parts = [part for part in self.path.split('?')[0].split('/') if part]
+        try:
+            data = self.read_json()
+            if parts == ['jobs']:
+                client = data.get('client') or self.headers.get('X-Client-Id') or self.client_address[0]
+                job = self.service.submit(data, client=client, priority=data.get('priority', 0))
+                return self.send_json({'id': job.id, 'status': job.status}, 201)
+            if parts == ['proxies', 'test']:
+                results = self.service.test_proxies(data.get('type', 'http'), data.get('proxies', []),
+                                                    timeout=data.get('timeout', 5))
+                return self.send_json(results)
+        except (ValueError, TypeError) as e:
+            return self.send_json({'error': str(e)}, 400)
+        self.send_json({'error': 'Not found'}, 404)
+
+    def do_DELETE(self):
+        parts = [part for part in self.path.split('?')[0].split('/') if part]
+        if len(parts) == 2 and parts[0] == 'jobs':
+            if self.service.cancel(parts[1]):
+                return self.send_json({'id': parts[1], 'status': 'cancelled'})
+            return self.send_json({'error': 'Job is not queued'}, 409)
+        self.send_json({'error': 'Not found'}, 404)
+
+    def stream_job(self, job):
+        # Newline-delimited JSON; the connection closes once the job finishes
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.end_headers()
+        try:
+            for event in job.iter_events():
+                self.wfile.write(json.dumps(event).encode('utf-8') + b'\n')
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+def run_service(host="127.0.0.1", port=8765, workers=2, archive=None):
+    service = KeywordService(workers=workers)
+    service.tool.archive = archive
+    service.start()
+    handler = type('BoundKeywordServiceHandler', (KeywordServiceHandler,), {'service': service})
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"🔍 Keyword service listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+class KeywordServiceClient:
+    # Drop-in for InternetKeywordTool that forwards work to a running KeywordService
+    def __init__(self, base_url, client_id=None, priority=0):
+        self.base_url = base_url.rstrip('/')
+        self.client_id = client_id or f"gui-{os.getpid()}"
+        self.priority = priority
+        self.session = Session()
+        self.proxy_config = None
+        self.proxy_health = {}
+        self.network_stats = (0.0, 0.0, 0.0)
+
+    def set_proxy(self, proxy_type, proxy_url):
+        # Kept client-side and sent with each job, so other clients' jobs are unaffected
+        if proxy_type == "proxyless":
+            self.proxy_config = None
+        else:
+            build_proxy_config(proxy_type, proxy_url)
+            self.proxy_config = {'type': proxy_type, 'url': proxy_url}
+
+    def test_proxy(self, proxy_type, proxy_url, timeout=10):
+        try:
+            response = self.session.post(f"{self.base_url}/proxies/test",
+                                         json={'type': proxy_type, 'proxies': [proxy_url], 'timeout': timeout},
+                                         timeout=timeout + 10)
+            health = response.json()[proxy_url]
+            self.proxy_health[(proxy_type, proxy_url)] = health
+            return health['valid'], health['detail']
+        except Exception as e:
+            return False, str(e)
+
+    def get_network_stats(self):
+        return self.network_stats
+
+    def reset_network_stats(self):
+        self.network_stats = (0.0, 0.0, 0.0)
+
+    def search_keywords(self, seed_keyword, max_results=200, max_pages=1, progress_callback=None, markets=None, result_callback=None):
+        payload = {
+            'seeds': [seed_keyword] if isinstance(seed_keyword, str) else list(seed_keyword),
+            'max_results': max_results,
+            'max_pages': max_pages,
+            'markets': markets or [DEFAULT_MARKET],
+            'client': self.client_id,
+            'priority': self.priority,
+            'proxy': self.proxy_config
+        }
+        response = self.session.post(f"{self.base_url}/jobs", json=payload, timeout=10)
+        response.raise_for_status()
+        job_id = response.json()['id']
+        if progress_callback:
+            progress_callback(f"⏳ Queued as job {job_id}...")
+        with self.session.get(f"{self.base_url}/jobs/{job_id}/stream", stream=True, timeout=60) as stream:
+            for line in stream.iter_lines():
+                if not line:
+                    continue
+                event = json.loads(line)
+                if event['type'] == 'progress':
+                    self.network_stats = tuple(event['stats'])
+                    if progress_callback:
+                        progress_callback(event['message'])
+                elif event['type'] == 'keywords' and result_callback:
+                    result_callback(event['locale'], event['seed'], event['source'], event['keywords'])
+                elif event['type'] == 'done':
+                    results = event['results']
+                    return results if markets is not None else next(iter(results.values()))
+                elif event['type'] == 'error':
+                    raise RuntimeError(event['error'])
+        raise RuntimeError(f"Lost connection to keyword service while waiting for job {job_id}")
 
 class ModernKeywordToolGUI:
-    def __init__(self, root):
+    def __init__(self, root, service_url=None, index_path=None, archive=None):
         self.root = root
         self.root.title("🔍 Internet Keyword Research Tool")
         self.root.geometry("1200x800")
-        self.tool = InternetKeywordTool()
-        self.all_keywords = set()
+        if service_url:
+            self.tool = KeywordServiceClient(service_url)
+        else:
+            self.tool = InternetKeywordTool()
+            self.tool.archive = archive
+        self.index_path = index_path
+        self.all_keywords = KeywordIndex()
+        # (keyword, locale, source, seed, rank) records, saved next to the index as <index>.meta
+        self.records_path = f"{index_path}.meta" if index_path else None
+        self.keyword_records = KeywordIndex()
+        index_error = None
+        records_error = None
+        if index_path and os.path.exists(index_path):
+            # Don't overwrite a file we couldn't read when the window closes
+            try:
+                self.all_keywords = KeywordIndex.open(index_path)
+            except (OSError, ValueError) as e:
+                index_error = str(e)
+                self.index_path = None
+                self.records_path = None
+        if self.records_path and os.path.exists(self.records_path):
+            try:
+                self.keyword_records = KeywordIndex.open(self.records_path)
+            except (OSError, ValueError) as e:
+                records_error = str(e)
+                self.records_path = None
+        self.export_threads = []
         self.proxy_list = []
         self.valid_proxies = []
+        self.valid_proxy_types = {}
         self.current_proxy = None
         self.setup_ui()
         self.update_network_stats()
+        self.keyword_count_label.config(text=f"Total Keywords: {len(self.all_keywords)}")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        if index_error:
+            messagebox.showwarning("⚠️ Warning", f"Could not load keyword index {index_path}:\n{index_error}\n\n"
+                                   "Starting with an empty index; the file will not be overwritten.")
+        elif records_error:
+            messagebox.showwarning("⚠️ Warning", f"Could not load keyword metadata {index_path}.meta:\n{records_error}\n\n"
+                                   "Keywords were loaded and will still be saved, but their locale, source, seed "
+                                   "and rank are missing; the metadata file will not be overwritten.")
+        
+    def on_close(self):
+        if any(thread.is_alive() for thread in self.export_threads):
+            messagebox.showwarning("⚠️ Warning", "An export is still running, please wait for it to finish")
+            return
+        if self.index_path:
+            try:
+                self.all_keywords.save(self.index_path)
+                if self.records_path:
+                    self.keyword_records.save(self.records_path)
+            except Exception as e:
+                messagebox.showerror("❌ Error", f"Failed to save keyword index:\n{str(e)}")
+        self.root.destroy()
         
     def setup_ui(self):
         main_container = ttk.Frame(self.root)
@@ -408,6 +1623,12 @@ class ModernKeywordToolGUI:
         max_pages_entry = ttk.Entry(settings_row1, textvariable=self.max_pages_var, 
                                    width=12, bootstyle="info")
         max_pages_entry.pack(side=LEFT, padx=(15, 0))
+        ttk.Label(settings_row1, text="Markets:", font=('Segoe UI', 11), 
+                 foreground='#87CEEB').pack(side=LEFT, padx=(20, 0))
+        self.markets_var = tk.StringVar(value=DEFAULT_MARKET)
+        markets_entry = ttk.Entry(settings_row1, textvariable=self.markets_var, 
+                                 width=24, bootstyle="info")
+        markets_entry.pack(side=LEFT, padx=(15, 0))
         button_frame = ttk.Frame(settings_row1)
         button_frame.pack(side=RIGHT)
         self.export_button = ttk.Button(button_frame, text="💾 Export", 
@@ -576,6 +1797,7 @@ class ModernKeywordToolGUI:
         
     def validate_proxies_thread(self):
         self.valid_proxies = []
+        self.valid_proxy_types = {}
         proxy_type = self.proxy_type_var.get()
         for i, proxy in enumerate(self.proxy_list):
             try:
@@ -583,6 +1805,7 @@ class ModernKeywordToolGUI:
                 is_valid, result = self.tool.test_proxy(proxy_type, proxy, timeout=5)
                 if is_valid:
                     self.valid_proxies.append(proxy)
+                    self.valid_proxy_types[proxy] = proxy_type
                     self.root.after(0, self.update_proxy_in_list, i, proxy, "✅", "valid")
                 else:
                     self.root.after(0, self.update_proxy_in_list, i, proxy, "❌", "invalid")
@@ -659,17 +1882,22 @@ class ModernKeywordToolGUI:
             return
         filename = filedialog.asksaveasfilename(
             title="Save Valid Proxies",
-            defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("Gzipped CSV files", "*.csv.gz"), ("JSON Lines files", "*.jsonl"),
+                       ("Gzipped JSON Lines files", "*.jsonl.gz"), ("Zstd JSON Lines files", "*.jsonl.zst"),
+                       ("Parquet files", "*.parquet"), ("Arrow files", "*.arrow"), ("Text files", "*.txt"),
+                       ("All files", "*.*")]
         )
         if filename:
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    for proxy in self.valid_proxies:
-                        f.write(f"{proxy}\n")
-                messagebox.showinfo("✅ Success", f"Exported {len(self.valid_proxies)} valid proxies to {filename}")
-            except Exception as e:
-                messagebox.showerror("❌ Error", f"Failed to export proxies:\n{str(e)}")
+            def rows():
+                for proxy in list(self.valid_proxies):
+                    proxy_type = self.valid_proxy_types.get(proxy)
+                    health = self.tool.proxy_health.get((proxy_type, proxy), {})
+                    latency = health.get('latency')
+                    yield (proxy, proxy_type, health.get('valid', True), latency * 1000 if latency is not None else None,
+                           health.get('checked'), health.get('detail'))
+            self.run_export(filename, PROXY_EXPORT_COLUMNS, rows(), "valid proxies",
+                            self.export_valid_button, self.proxy_status_label)
                 
     def search_keywords_wrapper(self, event=None):
         keyword = self.keyword_entry.get().strip()
@@ -690,37 +1918,74 @@ class ModernKeywordToolGUI:
         except ValueError:
             messagebox.showwarning("⚠️ Warning", "Please enter a valid number for max pages (1-10)")
             return
+        try:
+            markets = [format_market(market) for market in self.markets_var.get().split(',') if market.strip()]
+            if not markets:
+                raise ValueError("At least one market is required")
+        except ValueError:
+            messagebox.showwarning("⚠️ Warning", "Please enter markets as comma separated locales (e.g. en-US, de-DE)")
+            return
         self.search_button.config(state='disabled')
         self.progress['value'] = 0
         self.progress['maximum'] = 100
         self.status_label.config(text="🔍 Starting keyword research...")
-        thread = threading.Thread(target=self.search_keywords_thread, args=(keyword, max_results, max_pages))
+        thread = threading.Thread(target=self.search_keywords_thread, args=(keyword, max_results, max_pages, markets))
         thread.daemon = True
         thread.start()
         
-    def search_keywords_thread(self, keyword, max_results, max_pages):
+    def search_keywords_thread(self, keyword, max_results, max_pages, markets):
         def update_progress(message):
-            self.status_label.config(text=message)
-            if "Progress:" in message:
-                try:
-                    percentage = float(message.split("Progress: ")[1].split("%")[0])
-                    self.progress['value'] = percentage
-                except:
-                    pass
-            self.update_network_stats()
+            # Called from the tool's worker threads, so hand the widget updates to Tk
+            self.root.after(0, self.show_progress, message)
+        sources = {}
+        sources_lock = threading.Lock()
+        def stream_results(locale, seed, source_name, keywords):
+            # Keeps the best-ranked source per (locale, keyword); only keywords that survive the
+            # final cleanup are recorded once the search finishes
+            with sources_lock:
+                for rank, found in enumerate(keywords, 1):
+                    key = (locale, found.strip())
+                    if key not in sources or rank < sources[key][2]:
+                        sources[key] = (source_name, seed, rank)
+            self.root.after(0, self.append_results, locale, keywords)
         try:
-            self.tool.session.bytes_sent = 0
-            self.tool.session.bytes_received = 0
-            self.tool.session.start_time = time.time()
-            keywords = self.tool.search_keywords(keyword, max_results, max_pages, progress_callback=update_progress)
-            self.all_keywords.update(keywords)
-            self.root.after(0, self.update_results, keywords)
+            self.tool.reset_network_stats()
+            self.root.after(0, self.results_text.delete, 1.0, tk.END)
+            results = self.tool.search_keywords(keyword, max_results, max_pages, progress_callback=update_progress,
+                                                markets=markets, result_callback=stream_results)
+            for locale, keywords in results.items():
+                self.all_keywords.update(keywords)
+                self.keyword_records.update(
+                    keyword_record_key(found, locale, *sources.get((locale, found.strip()), (None, None, None)))
+                    for found in keywords)
+            self.root.after(0, self.update_results, results)
         except Exception as e:
             self.root.after(0, self.search_error, str(e))
             
-    def update_results(self, keywords):
+    def show_progress(self, message):
+        self.status_label.config(text=message)
+        if "Progress:" in message:
+            try:
+                percentage = float(message.split("Progress: ")[1].split("%")[0])
+                self.progress['value'] = percentage
+            except:
+                pass
+        
+    def append_results(self, locale, keywords):
+        self.results_text.insert(tk.END, "\n".join(f"[{locale}] {keyword}" for keyword in keywords) + "\n")
+        self.results_text.see(tk.END)
+        
+    def update_results(self, results):
         self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, "\n".join(keywords))
+        if len(results) == 1:
+            keywords = next(iter(results.values()))
+            self.results_text.insert(tk.END, "\n".join(keywords))
+        else:
+            keywords = []
+            for locale, locale_keywords in results.items():
+                self.results_text.insert(tk.END, f"🌍 [{locale}] {len(locale_keywords)} keywords\n")
+                self.results_text.insert(tk.END, "\n".join(locale_keywords) + "\n\n")
+                keywords.extend(locale_keywords)
         self.keyword_count_label.config(text=f"Total Keywords: {len(self.all_keywords)}")
         self.status_label.config(text="✅ Keyword research complete!")
         self.progress['value'] = 0
@@ -743,21 +2008,49 @@ class ModernKeywordToolGUI:
             return
         filename = filedialog.asksaveasfilename(
             title="Save Keywords",
-            defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("Gzipped CSV files", "*.csv.gz"), ("JSON Lines files", "*.jsonl"),
+                       ("Gzipped JSON Lines files", "*.jsonl.gz"), ("Zstd JSON Lines files", "*.jsonl.zst"),
+                       ("Parquet files", "*.parquet"), ("Arrow files", "*.arrow"), ("Text files", "*.txt"),
+                       ("All files", "*.*")]
         )
         if filename:
+            rows = iter_keyword_rows(self.all_keywords, self.keyword_records)
+            self.run_export(filename, KEYWORD_EXPORT_COLUMNS, rows, "keywords", self.export_button, self.status_label)
+                
+    def run_export(self, filename, columns, rows, label, button, status_label):
+        # Writes on a background thread so large exports don't block the GUI
+        try:
+            detect_export_format(filename)
+        except ValueError as e:
+            messagebox.showerror("❌ Error", str(e))
+            return
+        # Pull the first row here so the rows iterate a snapshot taken now, not when the thread starts
+        first = next(rows, None)
+        rows = chain([first], rows) if first is not None else iter(())
+        button.config(state='disabled')
+        status_label.config(text=f"💾 Exporting {label}...")
+        def report(count):
+            self.root.after(0, status_label.config, {'text': f"💾 Exporting {label}... {count:,} rows"})
+        def worker():
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    for keyword in self.all_keywords:
-                        f.write(f"{keyword}\n")
-                messagebox.showinfo("✅ Success", f"Exported {len(self.all_keywords)} keywords to {filename}")
+                count = export_rows(filename, columns, rows, progress_callback=report)
+                self.root.after(0, status_label.config, {'text': f"✅ Exported {count:,} {label}"})
+                self.root.after(0, messagebox.showinfo, "✅ Success", f"Exported {count} {label} to {filename}")
             except Exception as e:
-                messagebox.showerror("❌ Error", f"Failed to export keywords:\n{str(e)}")
+                self.root.after(0, status_label.config, {'text': "❌ Export failed"})
+                self.root.after(0, messagebox.showerror, "❌ Error", f"Failed to export {label}:\n{str(e)}")
+            finally:
+                self.root.after(0, button.config, {'state': 'normal'})
+        thread = threading.Thread(target=worker)
+        thread.daemon = True
+        self.export_threads = [t for t in self.export_threads if t.is_alive()] + [thread]
+        thread.start()
                 
     def clear_results(self):
         if messagebox.askyesno("🗑️ Confirm", "Are you sure you want to clear all keywords?"):
             self.all_keywords.clear()
+            self.keyword_records.clear()
             self.results_text.delete(1.0, tk.END)
             self.keyword_count_label.config(text="Total Keywords: 0")
             self.status_label.config(text="✨ Ready to discover keywords...")
@@ -765,8 +2058,38 @@ class ModernKeywordToolGUI:
             self.update_network_stats()
 
 def main():
+    parser = argparse.ArgumentParser(description="Internet Keyword Research Tool")
+    parser.add_argument('--serve', action='store_true', help="run the local keyword research service instead of the GUI")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, help="number of jobs the service runs at once (default 2), or replay processes (default one per core)")
+    parser.add_argument('--service-url', help="run the GUI as a client of a running service, e.g. http://127.0.0.1:8765")
+    parser.add_argument('--index', help="keyword index file to load accumulated keywords from and save them to on exit")
+    parser.add_argument('--record', help="append every raw provider response to this archive file")
+    parser.add_argument('--replay', help="re-parse an archive offline and print the results as JSON lines")
+    parser.add_argument('--replay-provider', help="only replay responses from this provider (google, bing, serp, ...)")
+    args = parser.parse_args()
+    if args.replay:
+        start = time.time()
+        count = 0
+        failed = 0
+        for result in replay_archive(args.replay, workers=args.workers, provider=args.replay_provider):
+            print(json.dumps(result))
+            count += 1
+            if result['error'] is not None:
+                failed += 1
+        elapsed = max(time.time() - start, 1e-6)
+        print(f"🔁 Replayed {count} responses in {elapsed:.2f}s ({count / elapsed:.0f}/s), "
+              f"{failed} failed to parse", file=sys.stderr)
+        return
+    if args.record and args.service_url:
+        parser.error("--record has no effect with --service-url; pass it to the --serve process instead")
+    archive = ResponseArchive(args.record) if args.record else None
+    if args.serve:
+        run_service(args.host, args.port, args.workers or 2, archive)
+        return
     root = ttk.Window(themename="darkly")
-    app = ModernKeywordToolGUI(root)
+    app = ModernKeywordToolGUI(root, service_url=args.service_url, index_path=args.index, archive=archive)
     root.mainloop()
 
 if __name__ == "__main__":
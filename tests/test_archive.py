@@ -0,0 +1,42 @@
+import json
+
+from keyword_tool import ResponseArchive, replay_archive
+
+
+def record_fixtures(path):
+    archive = ResponseArchive(path)
+    archive.record('google', 'shoes', 'en-US', 'http://suggest/?q=shoes',
+                   json.dumps(["shoes", ["shoes for men", "shoes near me", "ab"]]))
+    archive.record('google', 'boots', 'en-US', 'http://suggest/?q=boots', '<html>captcha</html>',
+                   status=429, headers={'Retry-After': '60'})
+    archive.record('bing', 'socks', 'de-DE', 'https://bing/?q=socks',
+                   '<ul><li class="sa_sg" query="socks sale"></li></ul>')
+    archive.record('google', 'hats', 'en-US', 'http://suggest/?q=hats', '{not json')
+    archive.close()
+    # An interrupted write leaves a torn last index line
+    with open(f"{path}.idx", 'a', encoding='utf-8') as f:
+        f.write('{"offset": 12, "length"')
+    return archive
+
+
+def test_archive_entries_keep_status_and_skip_torn_line(tmp_path):
+    archive = record_fixtures(str(tmp_path / "responses.bin"))
+    entries = list(archive.entries())
+    assert [entry['query'] for entry in entries] == ['shoes', 'boots', 'socks', 'hats']
+    assert entries[1]['status'] == 429
+    assert entries[1]['headers'] == {'Retry-After': '60'}
+    assert archive.read(entries[1]) == '<html>captcha</html>'
+    assert [entry['query'] for entry in archive.entries(provider='bing')] == ['socks']
+
+
+def test_record_replay_round_trip(tmp_path):
+    path = str(tmp_path / "responses.bin")
+    record_fixtures(path)
+    results = {result['query']: result for result in replay_archive(path, workers=1, chunk_size=2)}
+    # Non-200 responses are kept in the archive but have nothing to parse
+    assert sorted(results) == ['hats', 'shoes', 'socks']
+    assert sorted(results['shoes']['keywords']) == ['shoes for men', 'shoes near me']
+    assert results['shoes']['error'] is None
+    assert results['socks']['keywords'] == ['socks sale']
+    assert results['hats']['keywords'] == []
+    assert results['hats']['error'].startswith('JSONDecodeError')
@@ -0,0 +1,91 @@
+import csv
+import gzip
+import io
+import json
+import os
+
+import pytest
+
+from keyword_tool import (KEYWORD_EXPORT_COLUMNS, KeywordIndex, detect_export_format, export_rows,
+                          iter_keyword_rows, keyword_record_key)
+
+
+def test_keyword_rows_one_per_locale_with_best_rank():
+    keywords = KeywordIndex(["shoes", "shoes men", "solo"])
+    records = KeywordIndex([
+        keyword_record_key("shoes", "en-US", "google", "shoe", 3),
+        keyword_record_key("shoes", "en-US", "bing", "shoe", 1),
+        keyword_record_key("shoes", "de-DE", "google", "shoe", 2),
+        keyword_record_key("shoes men", "en-US", "google", "shoe", 10),
+    ])
+    assert list(iter_keyword_rows(keywords, records)) == [
+        ("shoes", "de-DE", "google", "shoe", 2),
+        ("shoes", "en-US", "bing", "shoe", 1),
+        ("shoes men", "en-US", "google", "shoe", 10),
+        ("solo", None, None, None, None),
+    ]
+
+
+@pytest.mark.parametrize("name", ["keywords.json", "keywords", "keywords.arrow.gz", "keywords.arrow.zst",
+                                  "keywords.parquet.gz", "keywords.parquet.zst"])
+def test_detect_export_format_rejects_unsupported_files(name):
+    with pytest.raises(ValueError):
+        detect_export_format(name)
+
+
+def test_failed_export_leaves_no_file(tmp_path):
+    def rows():
+        yield ("shoes", None, None, None, None)
+        raise RuntimeError("boom")
+    path = str(tmp_path / "keywords.csv")
+    with pytest.raises(RuntimeError):
+        export_rows(path, KEYWORD_EXPORT_COLUMNS, rows())
+    assert os.listdir(tmp_path) == []
+
+
+def test_txt_export_writes_each_keyword_once(tmp_path):
+    keywords = KeywordIndex(["shoes", "socks"])
+    records = KeywordIndex([
+        keyword_record_key("shoes", "en-US", "google", "shoe", 1),
+        keyword_record_key("shoes", "de-DE", "google", "shoe", 2),
+    ])
+    path = tmp_path / "keywords.txt"
+    assert export_rows(str(path), KEYWORD_EXPORT_COLUMNS, iter_keyword_rows(keywords, records)) == 2
+    assert path.read_text(encoding="utf-8") == "shoes\nsocks\n"
+
+
+ROWS = [("café shoes", "fr-FR", "google", "shoes", 1), ("shoes", "en-US", None, None, None)]
+
+
+def test_csv_gzip_round_trip(tmp_path):
+    path = str(tmp_path / "keywords.csv.gz")
+    assert export_rows(path, KEYWORD_EXPORT_COLUMNS, iter(ROWS), batch_size=1) == 2
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+        assert list(csv.reader(f)) == [["keyword", "locale", "source", "seed", "rank"],
+                                       ["café shoes", "fr-FR", "google", "shoes", "1"],
+                                       ["shoes", "en-US", "", "", ""]]
+
+
+def test_jsonl_zstd_round_trip(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "keywords.jsonl.zst"
+    export_rows(str(path), KEYWORD_EXPORT_COLUMNS, iter(ROWS))
+    text = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(path.read_bytes())).read().decode("utf-8")
+    names = [name for name, _ in KEYWORD_EXPORT_COLUMNS]
+    assert [json.loads(line) for line in text.splitlines()] == [dict(zip(names, row)) for row in ROWS]
+
+
+@pytest.mark.parametrize("name, codec", [("keywords.parquet", None), ("keywords.parquet", "zstd"),
+                                         ("keywords.arrow", None), ("keywords.arrow", "zstd")])
+def test_columnar_round_trip(tmp_path, name, codec):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+    path = str(tmp_path / name)
+    assert export_rows(path, KEYWORD_EXPORT_COLUMNS, iter(ROWS), batch_size=1, codec=codec) == 2
+    if name.endswith(".parquet"):
+        table = pq.read_table(path)
+    else:
+        with pa.memory_map(path) as source:
+            table = pa.ipc.open_file(source).read_all()
+    assert [tuple(row.values()) for row in table.to_pylist()] == ROWS
+    assert table.schema.field("rank").type == pa.int64()
@@ -0,0 +1,136 @@
+import random
+import threading
+
+import pytest
+
+from keyword_tool import KeywordIndex, decode_varint, encode_varint
+
+
+def make_keywords(count, seed=7):
+    rng = random.Random(seed)
+    words = ["best", "cheap", "running", "shoes", "for", "men", "women", "near", "me", "über", "café", "日本"]
+    return {" ".join(rng.choice(words) for _ in range(rng.randint(1, 5))) + f" {rng.randint(0, 999)}"
+            for _ in range(count)}
+
+
+def byte_sorted(keywords):
+    return sorted(keywords, key=lambda keyword: keyword.encode('utf-8'))
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 255, 300, 16383, 16384, 2 ** 32, 2 ** 63 - 1])
+def test_varint_round_trip(value):
+    encoded = encode_varint(value)
+    assert decode_varint(b"\xff" + encoded, 1) == (value, len(encoded) + 1)
+
+
+def test_iteration_matches_sorted_set():
+    keywords = make_keywords(5000)
+    index = KeywordIndex(keywords, compact_threshold=1000)
+    assert len(index) == len(keywords)
+    assert list(index) == byte_sorted(keywords)
+
+
+def test_contains():
+    keywords = make_keywords(3000)
+    index = KeywordIndex(keywords, compact_threshold=500)
+    assert all(keyword in index for keyword in keywords)
+    for missing in ["", "a", "best", "zzzz", "best shoes", "\x00", "日本日本日本 1000"]:
+        assert (missing in index) == (missing in keywords)
+
+
+@pytest.mark.parametrize("prefix", ["", "b", "best ", "best shoes", "café", "日", "zzz", "über men"])
+def test_prefix_matches_brute_force(prefix):
+    keywords = make_keywords(4000)
+    index = KeywordIndex(keywords, compact_threshold=700)
+    expected = byte_sorted(keyword for keyword in keywords if keyword.startswith(prefix))
+    assert list(index.prefix(prefix)) == expected
+    assert list(index.prefix(prefix, limit=3)) == expected[:3]
+
+
+def test_pending_keys_merge_with_snapshot():
+    index = KeywordIndex(["b", "d"])
+    index.compact()
+    index.update(["a", "c", "d", "e"])
+    assert len(index) == 5
+    assert list(index) == ["a", "b", "c", "d", "e"]
+    assert list(index.prefix("c")) == ["c"]
+
+
+def test_save_and_open_round_trip(tmp_path):
+    keywords = make_keywords(2000)
+    path = str(tmp_path / "keywords.idx")
+    KeywordIndex(keywords).save(path)
+    index = KeywordIndex.open(path)
+    assert len(index) == len(keywords)
+    assert list(index) == byte_sorted(keywords)
+    index.update(["brand new keyword"])
+    index.save(path)
+    reopened = KeywordIndex.open(path)
+    assert "brand new keyword" in reopened
+    assert len(reopened) == len(keywords) + 1
+
+
+def test_empty_index(tmp_path):
+    index = KeywordIndex()
+    assert len(index) == 0
+    assert list(index) == []
+    assert "a" not in index
+    assert list(index.prefix("a")) == []
+    path = str(tmp_path / "empty.idx")
+    index.save(path)
+    assert len(KeywordIndex.open(path)) == 0
+
+
+@pytest.mark.parametrize("damage", [
+    lambda data: b"",
+    lambda data: data[:10],
+    lambda data: data[:len(data) // 2],
+    lambda data: b"XXXX" + data[4:],
+])
+def test_open_rejects_corrupt_files(tmp_path, damage):
+    path = tmp_path / "keywords.idx"
+    KeywordIndex(make_keywords(500)).save(str(path))
+    path.write_bytes(damage(path.read_bytes()))
+    with pytest.raises(ValueError):
+        KeywordIndex.open(str(path))
+
+
+def test_iteration_is_a_frozen_snapshot(tmp_path):
+    keywords = make_keywords(3000)
+    path = str(tmp_path / "keywords.idx")
+    KeywordIndex(keywords).save(path)
+    index = KeywordIndex.open(path)
+    iterator = iter(index)
+    first = [next(iterator) for _ in range(10)]
+    index.update(["aaa new", "zzz new"])
+    index.compact()
+    index.clear()
+    assert first + list(iterator) == byte_sorted(keywords)
+    assert len(index) == 0
+
+
+def test_concurrent_updates_and_reads():
+    index = KeywordIndex(compact_threshold=200)
+    batches = [[f"keyword {worker} {i}" for i in range(1000)] for worker in range(4)]
+    errors = []
+
+    def writer(batch):
+        for start in range(0, len(batch), 50):
+            index.update(batch[start:start + 50])
+
+    def reader():
+        try:
+            for _ in range(20):
+                keys = list(index)
+                assert keys == byte_sorted(set(keys))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(batch,)) for batch in batches]
+    threads += [threading.Thread(target=reader) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert list(index) == byte_sorted(keyword for batch in batches for keyword in batch)
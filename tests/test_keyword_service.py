@@ -0,0 +1,109 @@
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from keyword_tool import InternetKeywordTool, KeywordService, KeywordServiceHandler, NetworkTrackingSession
+
+
+class StubSession(NetworkTrackingSession):
+    def __init__(self, delay=0.002):
+        super().__init__()
+        self.delay = delay
+        self.urls = []
+        self.fetches = []
+        self.lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        time.sleep(self.delay)
+        with self.lock:
+            self.urls.append(url)
+            self.fetches.append((time.time(), url))
+        return SimpleNamespace(status_code=200, text='[]', headers={})
+
+
+def make_tool():
+    tool = InternetKeywordTool()
+    tool.session = StubSession()
+    tool.default_host_delay = (0, 0)
+    tool.host_delays = {}
+    return tool
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.005)
+
+
+def test_higher_priority_job_is_interleaved_with_running_job():
+    tool = make_tool()
+    service = KeywordService(tool=tool, workers=2)
+    service.start()
+    markets = ["en-US", "en-GB", "de-DE", "fr-FR", "es-ES", "it-IT", "ja-JP", "pt-BR"]
+    job_a = service.submit({'seeds': ["alphaseed"], 'markets': markets}, client="alice", priority=0)
+    wait_for(lambda: len(tool.session.urls) >= 8)
+    job_b = service.submit({'seeds': ["bravoseed"], 'markets': ["en-US"]}, client="bob", priority=10)
+    wait_for(lambda: job_a.status == "done" and job_b.status == "done")
+    order = ['a' if 'alphaseed' in url else 'b' for url in tool.session.urls]
+    last_b = len(order) - 1 - order[::-1].index('b')
+    assert order.count('a') > order.count('b') > 0
+    # Every fetch of the urgent job runs before the bulk of the earlier job's fetches
+    assert order[last_b + 1:].count('a') > order.count('a') // 2
+
+
+def test_host_delay_does_not_hold_workers():
+    tool = make_tool()
+    tool.host_delays = {'www.google.com': (0.1, 0.1)}
+    markets = ["en-US", "en-GB", "de-DE", "fr-FR", "es-ES", "it-IT", "ja-JP", "pt-BR"]
+    start = time.time()
+    tool.search_keywords("seed", max_pages=3, markets=markets)
+    times = {}
+    for finished, url in tool.session.fetches:
+        times.setdefault('serp' if 'www.google.com' in url else 'other', []).append(finished - start)
+    assert len(times['serp']) == len(markets) * 3
+    # 24 SERP pages need over two seconds at this spacing; every other provider finishes long before
+    assert max(times['serp']) > 2
+    assert max(times['other']) < 0.5
+    serp = sorted(times['serp'])
+    assert all(b - a > 0.07 for a, b in zip(serp, serp[1:]))
+
+
+@pytest.mark.parametrize("proxy_type, proxies, timeout", [
+    ("http", "ab", 5),
+    ("http", [1, 2], 5),
+    ("http", [""], 5),
+    ("http", [f"10.0.0.{i}:8080" for i in range(21)], 5),
+    ("http", ["10.0.0.1:8080"], "5"),
+    ("http", ["10.0.0.1:8080"], 0),
+    ("http", ["10.0.0.1:8080"], True),
+    ("ftp", ["10.0.0.1:8080"], 5),
+])
+def test_test_proxies_rejects_bad_input(proxy_type, proxies, timeout):
+    tool = make_tool()
+    tested = []
+    tool.test_proxy = lambda *args, **kwargs: tested.append(args)
+    service = KeywordService(tool=tool)
+    with pytest.raises(ValueError):
+        service.test_proxies(proxy_type, proxies, timeout=timeout)
+    assert tested == []
+    assert tool.proxy_health == {}
+
+
+def test_proxies_endpoint_returns_400_for_bad_body():
+    service = KeywordService(tool=make_tool())
+    handler = type('Handler', (KeywordServiceHandler,), {'service': service})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        response = requests.post(f"http://127.0.0.1:{server.server_port}/proxies/test",
+                                 json={'proxies': "ab"}, timeout=5)
+        assert response.status_code == 400
+        assert 'proxies' in response.json()['error']
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,36 @@
+import pytest
+
+from keyword_tool import DEFAULT_MARKET, format_market, parse_market
+
+
+@pytest.mark.parametrize("market, expected", [
+    ("en-US", ("en", "us")),
+    ("de_DE", ("de", "de")),
+    ("pt-br", ("pt", "br")),
+    ("  fr-FR ", ("fr", "fr")),
+    (("gb", "en"), ("en", "gb")),
+    (["jp", "ja"], ("ja", "jp")),
+    ("ja", ("ja", "jp")),
+    ("en", ("en", "us")),
+    ("sv", ("sv", "se")),
+    ("da", ("da", "dk")),
+    ("ko", ("ko", "kr")),
+])
+def test_parse_market(market, expected):
+    assert parse_market(market) == expected
+
+
+@pytest.mark.parametrize("market", [None, "", ()])
+def test_parse_market_defaults(market):
+    assert format_market(market) == DEFAULT_MARKET
+
+
+@pytest.mark.parametrize("market", ["xx", "english", "en-USA", "en US", "EN-us", "en-U$", 42, ("us",), "en-US&x=1"])
+def test_parse_market_rejects_invalid(market):
+    with pytest.raises(ValueError):
+        parse_market(market)
+
+
+@pytest.mark.parametrize("market, expected", [("en-us", "en-US"), ("de_DE", "de-DE"), ("ja", "ja-JP"), (("ca", "fr"), "fr-CA")])
+def test_format_market(market, expected):
+    assert format_market(market) == expected